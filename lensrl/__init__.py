@@ -0,0 +1,10 @@
+"""LensRL - Reinforcement learning for lens design.
+
+Kramer Harrison, 2025
+"""
+import warnings
+
+# Ray tracing arbitrary lens designs routinely emits floating point warnings,
+# e.g. for rays that miss a surface. Filter them once here rather than around
+# every trace and optimization in the environment step.
+warnings.filterwarnings('ignore', category=RuntimeWarning, module='optiland')
@@ -0,0 +1,65 @@
+"""LensRL - Compiled kernels.
+
+This module defines small numerical kernels used in the optimization hot path.
+The kernels are compiled with Numba when it is installed, and fall back to
+equivalent NumPy implementations otherwise.
+
+Kramer Harrison, 2025
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rms_per_field_loop(x, y, field_idx, n_fields):
+    """
+    RMS spot size of each field, relative to the field centroid.
+
+    Args:
+        x: The x intersection points of all rays (float64).
+        y: The y intersection points of all rays (float64).
+        field_idx: The field index of each ray (int64).
+        n_fields: The number of fields.
+    """
+    count = np.zeros(n_fields)
+    sum_x = np.zeros(n_fields)
+    sum_y = np.zeros(n_fields)
+    for i in range(x.size):
+        count[field_idx[i]] += 1
+        sum_x[field_idx[i]] += x[i]
+        sum_y[field_idx[i]] += y[i]
+
+    mean_x = sum_x / count
+    mean_y = sum_y / count
+
+    # second pass over the deviations, which unlike sums of squares does not
+    # lose precision for small spots far from the axis
+    sum_r2 = np.zeros(n_fields)
+    for i in range(x.size):
+        k = field_idx[i]
+        sum_r2[k] += (x[i] - mean_x[k])**2 + (y[i] - mean_y[k])**2
+
+    return np.sqrt(sum_r2 / count)
+
+
+def _rms_per_field_numpy(x, y, field_idx, n_fields):
+    """NumPy equivalent of `_rms_per_field_loop`."""
+    count = np.bincount(field_idx, minlength=n_fields)
+    mean_x = np.bincount(field_idx, weights=x, minlength=n_fields) / count
+    mean_y = np.bincount(field_idx, weights=y, minlength=n_fields) / count
+
+    r2 = (x - mean_x[field_idx])**2 + (y - mean_y[field_idx])**2
+    sum_r2 = np.bincount(field_idx, weights=r2, minlength=n_fields)
+    return np.sqrt(sum_r2 / count)
+
+
+if njit is not None:
+    # compiled eagerly (and cached on disk), so the first optimization step
+    # does not pay for compilation
+    rms_per_field = njit('float64[:](float64[:], float64[:], int64[:], int64)',
+                         cache=True)(_rms_per_field_loop)
+else:
+    rms_per_field = _rms_per_field_numpy
@@ -10,10 +10,13 @@ These include:
 
 Kramer Harrison, 2025
 """
-import warnings
 from optiland import optimization
-from optiland.materials import Material
-from .glass import VALID_GLASSES
+from .glass import VALID_GLASSES, NUM_GLASSES, get_glass
+
+# Maximum optimizer iterations per step. The optimizer starts from the current
+# lens, i.e. the result of the previous step, so the optimization effectively
+# continues across steps rather than starting over.
+OPTIMIZER_MAXITER = 5
 
 
 class BaseAction:
@@ -50,29 +53,9 @@ class OptimizeRadiiAction(BaseAction):
         return True
 
     def execute(self, lens, params):
-        problem = optimization.OptimizationProblem()
-
-        # add RMS spot size operand
-        for field in lens.fields.get_field_coords():
-            input_data = {'optic': lens, 'surface_number': -1, 'Hx': field[0],
-                          'Hy': field[1], 'num_rays': 5, 'wavelength': 0.55,
-                          'distribution': 'hexapolar'}
-            problem.add_operand(operand_type='rms_spot_size', target=0,
-                                weight=1, input_data=input_data)
-
-        # add variables - all lens radii of curvature
-        # (exclude object and image surfaces)
-        num_surfaces = lens.surface_group.num_surfaces
-        for surf_idx in range(1, num_surfaces-1):
-            problem.add_variable(lens, 'radius', surface_number=surf_idx)
-
-        # add thickness variable for the last surface
-        problem.add_variable(lens, 'thickness', surface_number=num_surfaces-2)
-
+        problem = lens.build_opt_problem('radii')
         optimizer = optimization.OptimizerGeneric(problem)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            optimizer.optimize(maxiter=10)
+        optimizer.optimize(maxiter=OPTIMIZER_MAXITER)
 
 
 class OptimizeAllAction(BaseAction):
@@ -84,33 +67,9 @@ class OptimizeAllAction(BaseAction):
         return True
 
     def execute(self, lens, params):
-        problem = optimization.OptimizationProblem()
-
-        # add RMS spot size operand
-        for field in lens.fields.get_field_coords():
-            input_data = {'optic': lens, 'surface_number': -1, 'Hx': field[0],
-                          'Hy': field[1], 'num_rays': 5, 'wavelength': 0.55,
-                          'distribution': 'hexapolar'}
-            problem.add_operand(operand_type='rms_spot_size', target=0,
-                                weight=1, input_data=input_data)
-
-        # add variables - all lens radii of curvature
-        # (exclude object and image surfaces)
-        num_surfaces = lens.surface_group.num_surfaces
-        for surf_idx in range(1, num_surfaces-1):
-            problem.add_variable(lens, 'radius', surface_number=surf_idx)
-
-        # optimize thicknesses between lenses and image surface
-        n = lens.n(0.587)
-        for surf_idx in range(1, len(n)-1):
-            if n[surf_idx] == 1:
-                problem.add_variable(lens, 'thickness',
-                                     surface_number=surf_idx)
-
+        problem = lens.build_opt_problem('all')
         optimizer = optimization.OptimizerGeneric(problem)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            optimizer.optimize(maxiter=10)
+        optimizer.optimize(maxiter=OPTIMIZER_MAXITER)
 
 
 class OptimizeNone(BaseAction):
@@ -139,7 +98,7 @@ class AddLensAction(BaseAction):
         if thickness0 < 0 or thickness1 < 0:
             return False
 
-        if mat_idx < 0 or mat_idx >= len(VALID_GLASSES):
+        if mat_idx < 0 or mat_idx >= NUM_GLASSES:
             return False
 
         if radius0 == 0 or radius1 == 0:
@@ -158,7 +117,7 @@ class AddLensAction(BaseAction):
 
     def execute(self, lens, params):
         lens_idx = params[0]
-        material = Material(VALID_GLASSES[params[2]])
+        material = get_glass(VALID_GLASSES[params[2]])[2]
         radii = [params[3], params[4]]
         thicknesses = [params[5], params[6]]
         lens.add_lens(lens_idx, radii, thicknesses, material)
@@ -176,8 +135,8 @@ class ChangeGlassAction(BaseAction):
         if lens_idx < 0 or lens_idx >= num_lens:
             return False
 
-        glass_idx = params[0]
-        return glass_idx >= 0 and glass_idx < len(VALID_GLASSES)
+        glass_idx = params[2]
+        return glass_idx >= 0 and glass_idx < NUM_GLASSES
 
     def execute(self, lens, params):
         lens_idx = params[0]
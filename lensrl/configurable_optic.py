@@ -7,9 +7,11 @@ methods to make it easier to interact with the optic.
 Kramer Harrison, 2025
 """
 import numpy as np
-from optiland import optic, materials
+from optiland import optic, materials, optimization
+from optiland.distribution import create_distribution
 from optiland.fields import FieldGroup
-from .glass import VALID_GLASSES
+from . import operands  # noqa: F401 (registers custom operands)
+from .glass import VALID_GLASSES, get_glass, material_constants
 
 
 class ConfigurableOptic(optic.Optic):
@@ -19,8 +21,16 @@ class ConfigurableOptic(optic.Optic):
         super().__init__()
         self.f_number = f_number
         self.max_lenses = max_lenses
+        self._rng = np.random.default_rng()
         self.reset()
 
+        # fixed pupil sampling for the RMS spot size (SpotDiagram default)
+        self._pupil = create_distribution('hexapolar')
+        self._pupil.generate_points(num_rings=6)
+
+        # observation buffer: 4 system features + 6 features per lens
+        self._obs_buf = np.zeros(4 + max_lenses * 6, dtype=np.float32)
+
         self.rms = 1e6  # placeholder value for RMS spot size
 
     @property
@@ -36,6 +46,8 @@ class ConfigurableOptic(optic.Optic):
             self.add_field(y=self.field_of_view * 0.7)
             self.add_field(y=self.field_of_view)
 
+        self._topology_changed()
+
     def scale_to_unity_focal_length(self):
         """Scale the system to unity focal length"""
         f = self.paraxial.f2()
@@ -55,26 +67,29 @@ class ConfigurableOptic(optic.Optic):
 
         # add random starting lens
         if seed is not None:
-            np.random.seed(seed)
+            self._rng = np.random.default_rng(seed)
 
         # object surface
         self.add_surface(index=0, radius=np.inf, thickness=np.inf)
 
         # surface 1
-        radius = 1000 * np.random.rand()
-        thickness = 10 * np.random.rand()
-        material = np.random.choice(VALID_GLASSES)
+        radius = 1000 * self._rng.random()
+        thickness = 10 * self._rng.random()
+        material = get_glass(self._rng.choice(VALID_GLASSES))[2]
         self.add_surface(index=1, radius=radius, thickness=thickness,
                          material=material, is_stop=True)
+        self._stop_idx = 1
 
         # surface 2
-        radius = -1000 * np.random.rand()
-        thickness = 100 * np.random.rand()
+        radius = -1000 * self._rng.random()
+        thickness = 100 * self._rng.random()
         self.add_surface(index=2, radius=radius, thickness=thickness)
 
         # image surface
         self.add_surface(index=3)
 
+        self._topology_changed()
+
     def add_lens(self, lens_idx, radii, thicknesses, material):
         idx = lens_idx * 2 + 1
         self.add_surface(index=idx, radius=radii[0], thickness=thicknesses[0],
@@ -82,51 +97,145 @@ class ConfigurableOptic(optic.Optic):
         self.add_surface(index=idx+1, radius=radii[1],
                          thickness=thicknesses[1])
 
+        # the two new surfaces shift the stop if inserted in front of it
+        if idx <= self._stop_idx:
+            self._stop_idx += 2
+
         # workaround
         self.set_thickness(thicknesses[1], idx+1)
 
+        self._topology_changed()
+
     def move_stop(self, surface_idx):
-        for idx, surf in enumerate(self.surface_group.surfaces):
-            if idx == surface_idx:
-                surf.is_stop = True
-            else:
-                surf.is_stop = False
+        surfaces = self.surface_group.surfaces
+        surfaces[self._stop_idx].is_stop = False
+        surfaces[surface_idx].is_stop = True
+        self._stop_idx = surface_idx
+
+        self._topology_changed()
 
     def change_glass(self, lens_idx, material):
         idx = lens_idx * 2 + 1
-        new_mat = materials.Material(material)
-        self.surface_group.surfaces[idx].material_post = new_mat
+        self.surface_group.surfaces[idx].material_post = get_glass(material)[2]
+
+        self._topology_changed()
+
+    def build_opt_problem(self, kind):
+        """Return the optimization problem of the given kind.
+
+        'radii' varies all radii of curvature and the thickness to the image
+        surface. 'all' varies all radii of curvature and all air gaps. The
+        problem is cached and only rebuilt after the lens topology changes.
+        """
+        if kind in self._opt_problems:
+            return self._opt_problems[kind]
+
+        problem = optimization.OptimizationProblem()
+
+        # add RMS spot size operand, covering all fields in one trace. The
+        # field coordinates are converted to an array once here, rather than
+        # from a list of tuples on every merit function evaluation.
+        fields = np.array(self.fields.get_field_coords(), dtype=float)
+        input_data = {'optic': self, 'fields': fields, 'wavelength': 0.55,
+                      'num_rays': 5, 'distribution': 'hexapolar'}
+        problem.add_operand(operand_type='batched_rms', target=0, weight=1,
+                            input_data=input_data)
+
+        # add variables - all lens radii of curvature
+        # (exclude object and image surfaces)
+        num_surfaces = self.surface_group.num_surfaces
+        for surf_idx in range(1, num_surfaces-1):
+            problem.add_variable(self, 'radius', surface_number=surf_idx)
+
+        if kind == 'radii':
+            # add thickness variable for the last surface
+            problem.add_variable(self, 'thickness',
+                                 surface_number=num_surfaces-2)
+        elif kind == 'all':
+            # optimize thicknesses between lenses and image surface
+            n = self.n(0.587)
+            for surf_idx in range(1, len(n)-1):
+                if n[surf_idx] == 1:
+                    problem.add_variable(self, 'thickness',
+                                         surface_number=surf_idx)
+        else:
+            raise ValueError(f"Unknown optimization problem kind: {kind}")
+
+        self._opt_problems[kind] = problem
+        return problem
+
+    def _topology_changed(self):
+        """Invalidate state that depends on the surfaces, fields or stop."""
+        self._opt_problems = {}  # optimization problems by kind
+
+    def trace_spots(self, fields, wavelengths, pupil):
+        """Trace a pupil distribution for several fields and wavelengths.
+
+        All rays are traced together in a single pass through the system.
+        Returns the x and y image plane intersections, each with shape
+        (num_fields, num_wavelengths, num_rays).
+        """
+        fields = np.asarray(fields, dtype=float)
+        shape = (len(fields), len(wavelengths), pupil.x.size)
+
+        Hx = np.broadcast_to(fields[:, 0, None, None], shape).ravel()
+        Hy = np.broadcast_to(fields[:, 1, None, None], shape).ravel()
+        Px = np.broadcast_to(pupil.x, shape).ravel()
+        Py = np.broadcast_to(pupil.y, shape).ravel()
+        wavelength = np.broadcast_to(np.asarray(wavelengths)[:, None],
+                                     shape).ravel()
+
+        rays = self.ray_generator.generate_rays(Hx, Hy, Px, Py, wavelength)
+        self.surface_group.trace(rays)
+        return rays.x.reshape(shape), rays.y.reshape(shape)
+
+    def fast_rms(self):
+        """RMS spot radius for each field and wavelength.
+
+        Equivalent to `SpotDiagram(self).rms_spot_radius()`, but traces the
+        precomputed pupil distribution for all fields and wavelengths at once
+        and reduces the intersections directly.
+        """
+        x, y = self.trace_spots(self.fields.get_field_coords(),
+                                self.wavelengths.get_wavelengths(),
+                                self._pupil)
+
+        # spots are centered on the primary wavelength centroid
+        k = self.wavelengths.primary_index
+        x -= np.mean(x[:, k:k+1], axis=2, keepdims=True)
+        y -= np.mean(y[:, k:k+1], axis=2, keepdims=True)
+        return np.sqrt(np.mean(x**2 + y**2, axis=2))
 
     def complexity(self):
         return max([len(self.surface_group.surfaces) - 2, 0])
 
     def get_raw_observation(self):
-        t = np.diff(self.surface_group.positions.ravel())
-
-        data = []
-        for k, surf in enumerate(self.surface_group.surfaces[1:-1]):
-            if isinstance(surf.material_post, materials.Material):
-                n = surf.material_post.n(0.58756)
-                v = surf.material_post.abbe()
+        """Return the raw observation vector.
 
-                data += [n, v]
+        The returned array is an internal buffer that is overwritten on the
+        next call. Copy it if it must be kept.
+        """
+        t = np.diff(self.surface_group.positions.ravel())
 
-            r0 = surf.geometry.radius
-            data += [r0, t[k+1]]
+        data = self._obs_buf
+        data[4:] = 0
+        end = len(data)
 
-        data = np.array(data)
+        j = 4
+        for k, surf in enumerate(self.surface_group.surfaces[1:-1]):
+            if j >= end:  # limit size of data
+                break
 
-        # limit size of data
-        if len(data) > self.max_lenses * 6:
-            data = data[:self.max_lenses * 6]
+            if isinstance(surf.material_post, materials.Material):
+                data[j:j+2] = material_constants(surf.material_post)
+                j += 2
 
-        # pad with 0 to max number of lenses
-        max_elements = self.max_lenses * 6
-        data = np.pad(data, (0, max_elements - len(data)), 'constant')
+            data[j] = surf.geometry.radius
+            data[j+1] = t[k+1]
+            j += 2
 
-        # prepend metadata
+        # metadata
         num_surfaces = len(self.surface_group.surfaces)
-        data = np.concatenate([[self.rms, self.f_number, self.field_of_view,
-                                num_surfaces], data])
+        data[:4] = (self.rms, self.f_number, self.field_of_view, num_surfaces)
 
         return data
@@ -49,10 +49,7 @@ class LensDesignEnv(Env):
         self.lens = ConfigurableOptic(f_number=f_number, max_lenses=max_lenses)
 
     def reset(self, seed=None):
-        if seed is not None:
-            np.random.seed(seed)
-
-        self.lens.reset()
+        self.lens.reset(seed=seed)
         self.current_step = 0
         return self._get_normalized_observation(), {}
 
@@ -112,8 +109,9 @@ class LensDesignEnv(Env):
         # Normalize observation
         obs = self.observation_space.normalize(raw_observation)
 
-        # clip for numerical stability
-        return np.clip(obs, -1, 1)
+        # clip for numerical stability; normalize returns a new array on every
+        # call, so it can be clipped in place and handed out to the caller
+        return np.clip(obs, -1, 1, out=obs)
 
     def _calculate_reward(self):
         return self.reward(self.lens)
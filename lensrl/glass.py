@@ -5,8 +5,10 @@ Later, additional glass or material-related functionality may be added.
 
 Kramer Harrison, 2025
 """
+from optiland.materials import Material
+
 # Schott glass only
-VALID_GLASSES = [
+VALID_GLASSES = (
     'N-BALF5', 'N-PK52A', 'N-SSK2', 'N-LAF3', 'N-SK15',
     'N-ZK7', 'N-LAF34', 'N-LAF2', 'N-FK5', 'N-SF6',
     'N-BALF4', 'N-SSK5', 'N-BAK4', 'N-BAK2', 'N-SF14',
@@ -28,4 +30,36 @@ VALID_GLASSES = [
     'N-LASF46', 'N-LAK12', 'N-KZFS4', 'N-BAF52', 'N-BAF3',
     'N-SF57HT', 'N-LASF9HT', 'N-LASF31', 'N-LAK33A', 'N-LAK14',
     'N-BK10'
-]
+)
+
+NUM_GLASSES = len(VALID_GLASSES)
+
+# cache of (n_d, V_d, Material) per glass name, populated on first use
+_GLASS_CACHE = {}
+
+# (n_d, V_d) of the cached Material instances, keyed by id(material). The
+# instances are kept alive by _GLASS_CACHE, so their ids are never reused.
+_MATERIAL_CONSTANTS = {}
+
+
+def get_glass(name):
+    """Return (n_d, V_d, material) for a glass, loading the material once.
+
+    The material instance is shared between all callers and must not be
+    modified.
+    """
+    glass = _GLASS_CACHE.get(name)
+    if glass is None:
+        material = Material(name)
+        glass = (material.n(0.58756), material.abbe(), material)
+        _GLASS_CACHE[name] = glass
+        _MATERIAL_CONSTANTS[id(material)] = glass[:2]
+    return glass
+
+
+def material_constants(material):
+    """Return (n_d, V_d) of a material, using the glass cache if possible."""
+    constants = _MATERIAL_CONSTANTS.get(id(material))
+    if constants is None:
+        constants = (material.n(0.58756), material.abbe())
+    return constants
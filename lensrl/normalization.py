@@ -8,6 +8,7 @@ makes the reinforcement learning process more stable.
 
 Kramer Harrison, 2025
 """
+from functools import partial
 import numpy as np
 
 
@@ -15,36 +16,129 @@ class NormalizationUtility:
     """Normalization utility for the reinforcement learning environment."""
 
     def __init__(self):
+        # (method, inverse, kwargs) as registered, per parameter
+        self.definitions = {}
+        # (normalize, denormalize) callables with the kwargs bound
         self.scaling_methods = {}
 
     def register_parameter(self, name, method, **kwargs):
         """Register a parameter with a specific normalization method."""
         if name in self.scaling_methods:
             raise ValueError(f"Parameter {name} already registered.")
-        self.scaling_methods[name] = (method, kwargs)
+        inverse = kwargs.pop('inverse', None)
+        self.definitions[name] = (method, inverse, kwargs)
+        self.scaling_methods[name] = (
+            partial(method, **kwargs),
+            partial(inverse, **kwargs) if inverse is not None else None
+        )
 
     def normalize(self, name, value):
         """Normalize a value for a given parameter."""
-        if name not in self.scaling_methods:
-            raise ValueError(f"Parameter {name} not registered.")
-        method, kwargs = self.scaling_methods[name]
-        # Remove 'inverse' from kwargs before passing to the method
-        kwargs_copy = kwargs.copy()
-        kwargs_copy.pop('inverse', None)
-        return method(value, **kwargs_copy).astype(np.float32)
+        try:
+            forward, _ = self.scaling_methods[name]
+        except KeyError:
+            raise ValueError(f"Parameter {name} not registered.") from None
+        return forward(value)
 
     def denormalize(self, name, normalized_value):
         """Denormalize a value for a given parameter."""
-        if name not in self.scaling_methods:
-            raise ValueError(f"Parameter {name} not registered.")
-        method, kwargs = self.scaling_methods[name]
-        if "inverse" not in kwargs:
+        try:
+            _, inverse = self.scaling_methods[name]
+        except KeyError:
+            raise ValueError(f"Parameter {name} not registered.") from None
+        if inverse is None:
             raise ValueError(f"Inverse function not defined for "
                              f"parameter {name}.")
-        kwargs_copy = kwargs.copy()
-        kwargs_copy.pop('inverse', None)
-        value = kwargs["inverse"](normalized_value, **kwargs_copy)
-        return value.astype(np.float32)
+        return inverse(normalized_value)
+
+    def vectorize(self, names):
+        """Build a vectorized scaling table for an ordered list of
+        parameters."""
+        return ScalingTable(self, names)
+
+
+class ScalingTable:
+    """Vectorized normalization for a fixed, ordered list of parameters.
+
+    Min-max and log scaled parameters reduce to a single affine map,
+    ``scale * x + bias``, where log scaled parameters are passed through
+    ``np.log`` first. Reciprocally scaled parameters are handled by index.
+    Parameters registered with any other pair of methods fall back to the
+    scalar path of the `NormalizationUtility`.
+    """
+
+    def __init__(self, normalizer, names):
+        size = len(names)
+        self.normalizer = normalizer
+        self.names = list(names)
+
+        self.scale = np.ones(size, dtype=np.float32)
+        self.bias = np.zeros(size, dtype=np.float32)
+        self.log_mask = np.zeros(size, dtype=bool)
+        self.recip_mask = np.zeros(size, dtype=bool)
+        self.fallback = []
+
+        recip_factors = []
+        for idx, name in enumerate(self.names):
+            if name not in normalizer.definitions:
+                raise ValueError(f"Parameter {name} not registered.")
+            method, inverse, kwargs = normalizer.definitions[name]
+            methods = (method, inverse)
+
+            if methods == (min_max_scaling, inverse_min_max_scaling):
+                low, high = kwargs["min_val"], kwargs["max_val"]
+            elif methods == (log_scaling, inverse_log_scaling):
+                low, high = kwargs["log_min"], kwargs["log_max"]
+                self.log_mask[idx] = True
+            elif methods == (reciprocal_scaling, inverse_reciprocal_scaling):
+                self.recip_mask[idx] = True
+                recip_factors.append(kwargs["scale_factor"])
+                continue
+            else:
+                self.fallback.append(idx)
+                continue
+
+            self.scale[idx] = 2 / (high - low)
+            self.bias[idx] = -1 - 2 * low / (high - low)
+
+        self.recip_factors = np.array(recip_factors, dtype=np.float32)
+
+    def normalize(self, values):
+        """Normalize an array of values, one per parameter."""
+        raw = np.asarray(values)
+        normalized = raw.astype(np.float32)
+        normalized[self.log_mask] = np.log(normalized[self.log_mask])
+        recip = normalized[self.recip_mask]
+
+        normalized *= self.scale
+        normalized += self.bias
+        normalized[self.recip_mask] = reciprocal_scaling(recip,
+                                                         self.recip_factors)
+
+        if self.fallback:
+            normalized[self.fallback] = np.fromiter(
+                (self.normalizer.normalize(self.names[idx], raw[idx])
+                 for idx in self.fallback),
+                dtype=np.float32, count=len(self.fallback))
+        return normalized
+
+    def denormalize(self, normalized_values):
+        """Denormalize an array of values, one per parameter."""
+        normalized = np.asarray(normalized_values)
+        values = normalized.astype(np.float32)
+
+        values -= self.bias
+        values /= self.scale
+        values[self.log_mask] = np.exp(values[self.log_mask])
+        values[self.recip_mask] = inverse_reciprocal_scaling(
+            normalized[self.recip_mask], self.recip_factors)
+
+        if self.fallback:
+            values[self.fallback] = np.fromiter(
+                (self.normalizer.denormalize(self.names[idx], normalized[idx])
+                 for idx in self.fallback),
+                dtype=np.float32, count=len(self.fallback))
+        return values
 
 
 def min_max_scaling(value, min_val, max_val):
@@ -65,7 +159,7 @@ def inverse_log_scaling(normalized_value, log_min, log_max):
 
 def reciprocal_scaling(value, scale_factor):
     epsilon = 1e-10
-    denominator = 1 + abs(value) / (scale_factor + epsilon)
+    denominator = 1 + np.abs(value) / (scale_factor + epsilon)
     scaled_value = value / denominator
 
     return 2 * scaled_value - 1
@@ -75,10 +169,8 @@ def inverse_reciprocal_scaling(normalized_value, scale_factor):
     epsilon = 1e-10
     value = normalized_value / 2 + 0.5
     alpha = scale_factor + epsilon
-    if normalized_value >= 0:
-        return value / (1 - value / alpha)
-    else:
-        return value / (1 + value / alpha)
+    sign = np.where(normalized_value >= 0, -1.0, 1.0)
+    return value / (1 + sign * value / alpha)
 
 
 normalizer = NormalizationUtility()
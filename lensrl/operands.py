@@ -0,0 +1,53 @@
+"""LensRL - Operands module.
+
+This module defines custom optimization operands for the lens system. The
+operands are registered with the Optiland operand registry on import, so they
+can be used by name in an `OptimizationProblem`.
+
+Kramer Harrison, 2025
+"""
+import numpy as np
+from optiland.distribution import create_distribution
+from optiland.optimization.operand import operand_registry
+from ._fast import rms_per_field
+
+# pupil distributions per (distribution, num_rays), generated on first use
+_DISTRIBUTIONS = {}
+
+
+def _get_distribution(distribution, num_rays):
+    key = (distribution, num_rays)
+    if key not in _DISTRIBUTIONS:
+        pupil = create_distribution(distribution)
+        pupil.generate_points(num_rays)
+        _DISTRIBUTIONS[key] = pupil
+    return _DISTRIBUTIONS[key]
+
+
+def batched_rms(optic, fields, wavelength, num_rays=5,
+                distribution='hexapolar'):
+    """
+    Combined RMS spot size of several fields, traced in a single pass.
+
+    Returns the root sum of squares of the RMS spot size of each field on the
+    image surface. A single operand with target 0 therefore contributes the
+    same merit as one 'rms_spot_size' operand per field.
+
+    Args:
+        optic: The ConfigurableOptic object.
+        fields: The normalized (Hx, Hy) field coordinates, preferably as a
+            float array of shape (num_fields, 2).
+        wavelength: The wavelength of the rays.
+        num_rays: The number of rays to trace. Default is 5.
+        distribution: The distribution of the rays. Default is 'hexapolar'.
+    """
+    pupil = _get_distribution(distribution, num_rays)
+    x, y = optic.trace_spots(fields, [wavelength], pupil)
+
+    n_fields = x.shape[0]
+    field_idx = np.repeat(np.arange(n_fields, dtype=np.int64), pupil.x.size)
+    rms = rms_per_field(x.ravel(), y.ravel(), field_idx, n_fields)
+    return np.sqrt(np.sum(rms**2))
+
+
+operand_registry.register('batched_rms', batched_rms)
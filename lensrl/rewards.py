@@ -6,9 +6,7 @@ encourage the system to converge to a desired solution.
 
 Kramer Harrison, 2025
 """
-import warnings
 import numpy as np
-from optiland import analysis
 
 
 class BaseReward:
@@ -26,12 +24,9 @@ class RMSReward(BaseReward):
         self.nan_penalty = -1e3
 
     def __call__(self, lens):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            spot = analysis.SpotDiagram(lens)
-            rms = np.mean(np.abs(spot.rms_spot_radius()))
-            lens.rms = rms  # save for RMS state
-            reward = -self.weight * rms  # Negative for minimization
+        rms = np.mean(np.abs(lens.fast_rms()))
+        lens.rms = rms  # save for RMS state
+        reward = -self.weight * rms  # Negative for minimization
 
         if np.isnan(rms):
             rms = 1e6
@@ -10,7 +10,7 @@ Kramer Harrison, 2025
 import numpy as np
 from gymnasium import spaces
 from .normalization import normalizer
-from .glass import VALID_GLASSES
+from .glass import NUM_GLASSES
 
 
 class LensObservationSpace(spaces.Box):
@@ -38,11 +38,11 @@ class LensObservationSpace(spaces.Box):
         shape = (self.system_feature_size + self.max_lenses * self.lens_feature_size,)
         super().__init__(low=-1.0, high=1.0, shape=shape, dtype=np.float32)
 
+        # precomputed affine/log/reciprocal table for the per-step hot path
+        self._scaling = self.normalizer.vectorize(self.parameters)
+
     def normalize(self, raw_observation):
-        normalized = []
-        for param_name, value in zip(self.parameters, raw_observation):
-            normalized.append(self.normalizer.normalize(param_name, value))
-        normalized = np.array(normalized)
+        normalized = self._scaling.normalize(raw_observation)
 
         # mask
         num_lenses = (raw_observation[3] - 2) // 2
@@ -52,10 +52,7 @@ class LensObservationSpace(spaces.Box):
         return normalized
 
     def denormalize(self, observation):
-        raw = []
-        for param_name, value in zip(self.parameters, normalized_observation):
-            raw.append(self.normalizer.denormalize(param_name, value))
-        denormalized = np.array(raw)
+        denormalized = self._scaling.denormalize(observation)
 
         # mask
         num_lenses = (denormalized[3] - 2) // 2
@@ -85,7 +82,7 @@ class LensActionSpace(spaces.Box):
                  max_optim_actions=3,
                  max_update_actions=4,
                  max_lenses=5,
-                 max_materials=len(VALID_GLASSES),
+                 max_materials=NUM_GLASSES,
                  continuous_param_dim=4,
                  params=['radius', 'radius', 'lens_thickness', 'air_thickness']):
         """
@@ -105,17 +102,21 @@ class LensActionSpace(spaces.Box):
         self.continuous_param_dim = continuous_param_dim
         self.params = params
 
+        # precomputed tables for the per-step decode
+        num_choices = (max_optim_actions, max_update_actions, max_lenses,
+                       max_surfaces, max_materials)
+        self._disc_scale = np.array([(k - 1) / 2 for k in num_choices],
+                                    dtype=np.float32)
+        self._scaling = self.normalizer.vectorize(params)
+
     def decode(self, action: np.ndarray):
         """
         Decode and denormalize the action into format consisting of integers and floats.
         """
-        discrete_actions = [int((action[0] + 1) / 2 * (self.max_optim_actions - 1)),
-                            int((action[1] + 1) / 2 * (self.max_update_actions - 1)),
-                            int((action[2] + 1) / 2 * (self.max_lenses - 1)),
-                            int((action[3] + 1) / 2 * (self.max_surfaces - 1)),
-                            int((action[4] + 1) / 2 * (self.max_materials - 1))]
+        action = np.asarray(action)
+        discrete_actions = ((action[:5] + 1) * self._disc_scale).astype(np.int64)
 
         idx = self.continuous_param_dim
-        continuous_actions = [self.normalizer.denormalize(param, val) for param, val in zip(self.params, action[-idx:])]
-        action = tuple(discrete_actions) + tuple(continuous_actions)
+        continuous_actions = self._scaling.denormalize(action[-idx:])
+        action = tuple(discrete_actions.tolist()) + tuple(continuous_actions.tolist())
         return action